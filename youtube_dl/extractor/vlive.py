@@ -1,73 +1,80 @@
 # coding: utf-8
 from __future__ import unicode_literals
 
+import concurrent.futures
+import functools
+import itertools
+import operator
 import re
 import time
-import itertools
 
 from .common import InfoExtractor
 from .naver import NaverBaseIE
 from ..compat import compat_str
 from ..utils import (
+    clean_html,
     ExtractorError,
-    merge_dicts,
+    int_or_none,
     remove_start,
-    try_get,
     urlencode_postdata,
 )
 
-
-class VLiveIE(NaverBaseIE):
-    IE_NAME = 'vlive'
-    _VALID_URL = r'https?://(?:(?:www|m)\.)?vlive\.tv/video/(?P<id>[0-9]+)'
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_PRELOAD_STATE_PREFIX = 'window.__PRELOADED_STATE__='
+# A whole JSON string literal or a single brace
+_JSON_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]')
+_PLAYLIST_SEQS_RE = re.compile(r'playlistVideoSeqs\s*=\s*(\[[^]]+\])')
+_APP_JS_RE = re.compile(r'<script[^>]+src=(["\'])(?P<url>http.+?/app\.js.*?)\1')
+_APP_ID_RE = re.compile(r'Global\.VFAN_APP_ID\s*=\s*[\'"]([^\'"]+)[\'"]')
+
+_get_post_fields = operator.itemgetter('title', 'officialVideo')
+_get_status_fields = operator.itemgetter('upcomingYn', 'type')
+
+
+def _extract_json_object(string, start):
+    """Return the JSON object starting at string[start] or None if unbalanced"""
+    depth = 0
+    for mobj in _JSON_TOKEN_RE.finditer(string, start):
+        token = mobj.group(0)
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if depth == 0:
+                return string[start:mobj.end()]
+    return None
+
+
+class _PreloadView(object):
+    """Fields of a parsed preload state that are used during extraction"""
+    __slots__ = ('post', 'official', 'channel_name', 'thumb', 'title')
+
+    def __init__(self, preload_state):
+        self.post = preload_state['postDetail']['post']
+        self.title, self.official = _get_post_fields(self.post)
+        self.thumb = self.official.get('thumb')
+        self.channel_name = ((preload_state.get('channel') or {}).get(
+            'channel') or {}).get('channelName')
+
+
+class VLiveBaseIE(NaverBaseIE):
     _NETRC_MACHINE = 'vlive'
-    _TESTS = [{
-        'url': 'http://www.vlive.tv/video/1326',
-        'md5': 'cc7314812855ce56de70a06a27314983',
-        'info_dict': {
-            'id': '1326',
-            'ext': 'mp4',
-            'title': "[V LIVE] Girl's Day's Broadcast",
-            'creator': "Girl's Day",
-            'view_count': int,
-            'uploader_id': 'muploader_a',
-        },
-    }, {
-        'url': 'http://www.vlive.tv/video/16937',
-        'info_dict': {
-            'id': '16937',
-            'ext': 'mp4',
-            'title': '[V LIVE] 첸백시 걍방',
-            'creator': 'EXO',
-            'view_count': int,
-            'subtitles': 'mincount:12',
-            'uploader_id': 'muploader_j',
-        },
-        'params': {
-            'skip_download': True,
-        },
-    }, {
-        'url': 'https://www.vlive.tv/video/129100',
-        'md5': 'ca2569453b79d66e5b919e5d308bff6b',
-        'info_dict': {
-            'id': '129100',
-            'ext': 'mp4',
-            'title': '[V LIVE] [BTS+] Run BTS! 2019 - EP.71 :: Behind the scene',
-            'creator': 'BTS+',
-            'view_count': int,
-            'subtitles': 'mincount:10',
-        },
-        'skip': 'This video is only available for CH+ subscribers',
-    }]
-
-    @classmethod
-    def suitable(cls, url):
-        return False if VLivePlaylistIE.suitable(url) else super(VLiveIE, cls).suitable(url)
+    _LOGGED_IN = None
 
     def _real_initialize(self):
         self._login()
 
     def _login(self):
+        # Login cookies end up in the downloader's cookie jar, so a jar that
+        # is known to hold a session does not need to log in again
+        cookiejar = self._downloader.cookiejar
+        if VLiveBaseIE._LOGGED_IN is cookiejar:
+            return
+
         email, password = self._get_login_info()
         if None in (email, password):
             return
@@ -77,8 +84,7 @@ class VLiveIE(NaverBaseIE):
                 'https://www.vlive.tv/auth/loginInfo', None,
                 note='Downloading login info',
                 headers={'Referer': 'https://www.vlive.tv/home'})
-            return try_get(
-                login_info, lambda x: x['message']['login'], bool) or False
+            return (login_info.get('message') or {}).get('login') is True
 
         LOGIN_URL = 'https://www.vlive.tv/auth/email/login'
         self._request_webpage(
@@ -94,23 +100,11 @@ class VLiveIE(NaverBaseIE):
 
         if not is_logged_in():
             raise ExtractorError('Unable to log in', expected=True)
+        VLiveBaseIE._LOGGED_IN = cookiejar
 
-    def _real_extract(self, url):
-        video_id = self._match_id(url)
-
-        webpage = self._download_webpage(
-            f'https://www.vlive.tv/video/{video_id}', video_id)
-
-        PRELOAD_STATE_RE = r'>window\.__PRELOADED_STATE__=({.+})</script>'
-        PRELOAD_STATE_FIELD = 'preload state'
-
-        preload_state = self._parse_json(
-                self._search_regex(
-                    PRELOAD_STATE_RE, webpage, PRELOAD_STATE_FIELD),
-                video_id)
-
-        upcoming = preload_state['postDetail']['post']['officialVideo']['upcomingYn']
-        vid_type = preload_state['postDetail']['post']['officialVideo']['type']
+    def _extract_from_preload_state(self, video_id, preload_state, key_json=None):
+        state = _PreloadView(preload_state)
+        upcoming, vid_type = _get_status_fields(state.official)
 
         if vid_type == 'LIVE':
             if upcoming:
@@ -119,18 +113,14 @@ class VLiveIE(NaverBaseIE):
                 status = vid_type
         else:
             status = vid_type
-            key_webpage = self._download_webpage(
-                    f'https://www.vlive.tv/globalv-web/vam-web/video/v1.0/vod/{video_id}/inkey',
-                    video_id,
-                    headers={'Referer': f'https://www.vlive.tv/video/{video_id}'},
-                    note='Getting key'
-                    )
-            key = self._parse_json(key_webpage, video_id)['inkey']
+            key = (key_json or self._call_api(
+                f'video/v1.0/vod/{video_id}/inkey', video_id,
+                note='Getting key'))['inkey']
 
         if status in ('LIVE_ON_AIR', 'BIG_EVENT_ON_AIR', 'LIVE'):
-            return self._live(video_id, preload_state)
+            return self._live(video_id, state)
         elif status in ('VOD_ON_AIR', 'BIG_EVENT_INTRO', 'VOD'):
-            return self._replay(video_id, preload_state, key)
+            return self._replay(video_id, state, key)
 
         if status == 'LIVE_END':
             raise ExtractorError('Uploading for replay. Please wait...',
@@ -146,36 +136,57 @@ class VLiveIE(NaverBaseIE):
         else:
             raise ExtractorError('Unknown status %s' % status)
 
-    def _get_common_fields(self, preload_state):
+    def _call_api(self, path, video_id, note='Downloading JSON metadata',
+                  errnote='Unable to download JSON metadata', fatal=True):
+        # All API calls go to the same host as the video page; youtube-dl's
+        # urllib opener does not keep connections alive, so the best we can
+        # do is to keep the request count and headers in one place
+        return self._download_json(
+            'https://www.vlive.tv/globalv-web/vam-web/' + path, video_id,
+            note=note, errnote=errnote, fatal=fatal,
+            headers={'Referer': f'https://www.vlive.tv/video/{video_id}'})
+
+    def _get_common_fields(self, state):
         return {
-            'title': "[V LIVE] " + preload_state['postDetail']['post']['title'],
-            'creator': preload_state['channel']['channel']['channelName'],
-            'thumbnail': preload_state['postDetail']['post']['officialVideo']['thumb'],
+            'title': "[V LIVE] " + state.title,
+            'creator': state.channel_name,
+            'thumbnail': state.thumb,
         }
 
-    def _replay(self, video_id, preload_state, key):
-        long_video_id = preload_state['postDetail']['post']['officialVideo']['vodId']
-        return merge_dicts(
-                self._get_common_fields(preload_state),
-                self._extract_video_info(video_id, long_video_id, key))
+    def _replay(self, video_id, state, key):
+        long_video_id = state.official['vodId']
+        info = self._extract_video_info(video_id, long_video_id, key)
+        # VLive's own title and creator take precedence over Naver's metadata
+        info.update(
+            (k, v) for k, v in self._get_common_fields(state).items()
+            if v is not None)
+        return info
 
-    def _live(self, video_id, preload_state):
-        live_webpage = self._download_webpage(
-                f'https://www.vlive.tv/globalv-web/vam-web/old/v3/live/{video_id}/playInfo',
-                video_id,
-                headers={'Referer': f'https://www.vlive.tv/video/{video_id}'}
-        )
-        live_json = self._parse_json(live_webpage, video_id)
-
-        formats = []
-        for vid in live_json['result'].get('streamList', []):
-            formats.extend(self._extract_m3u8_formats(
-                vid['serviceUrl'], video_id, 'mp4',
-                m3u8_id=vid.get('streamName'),
-                fatal=False, live=True))
+    def _live(self, video_id, state):
+        live_json = self._call_api(
+            f'old/v3/live/{video_id}/playInfo', video_id)
+
+        streams = live_json['result'].get('streamList') or []
+        manifests = []
+        if streams:
+            # Fetch all master playlists at once and only parse them here
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(streams)) as executor:
+                manifests = list(executor.map(
+                    lambda vid: self._download_webpage_handle(
+                        vid['serviceUrl'], video_id,
+                        note='Downloading m3u8 information',
+                        errnote='Failed to download m3u8 information',
+                        fatal=False),
+                    streams))
+        formats = list(itertools.chain.from_iterable(
+            self._parse_m3u8_formats(
+                res[0], res[1].geturl(), 'mp4',
+                m3u8_id=vid.get('streamName'), live=True)
+            for vid, res in zip(streams, manifests) if res is not False))
         self._sort_formats(formats)
 
-        info = self._get_common_fields(preload_state)
+        info = self._get_common_fields(state)
         info.update({
             'id': video_id,
             'formats': formats,
@@ -183,6 +194,93 @@ class VLiveIE(NaverBaseIE):
         })
         return info
 
+    def _parse_preload_state(self, webpage, video_id):
+        # Slice out the object by balancing braces rather than with a greedy
+        # regex, which has to scan to the end of the page and backtrack
+        start = webpage.find(_PRELOAD_STATE_PREFIX)
+        preload_state = None
+        if start != -1:
+            start += len(_PRELOAD_STATE_PREFIX)
+            if webpage.startswith('{', start):
+                preload_state = _extract_json_object(webpage, start)
+        if not preload_state:
+            raise ExtractorError('Unable to extract preload state')
+        if orjson:
+            # orjson is considerably faster on the large preload state blob;
+            # anything it rejects goes through the regular parser below
+            try:
+                return orjson.loads(preload_state)
+            except ValueError:
+                pass
+        return self._parse_json(preload_state, video_id)
+
+
+class VLiveIE(VLiveBaseIE):
+    IE_NAME = 'vlive'
+    _VALID_URL = r'https?://(?:(?:www|m)\.)?vlive\.tv/video/(?P<id>[0-9]+)'
+    _VALID_URL_RE = re.compile(_VALID_URL)
+    _TESTS = [{
+        'url': 'http://www.vlive.tv/video/1326',
+        'md5': 'cc7314812855ce56de70a06a27314983',
+        'info_dict': {
+            'id': '1326',
+            'ext': 'mp4',
+            'title': "[V LIVE] Girl's Day's Broadcast",
+            'creator': "Girl's Day",
+            'view_count': int,
+            'uploader_id': 'muploader_a',
+        },
+    }, {
+        'url': 'http://www.vlive.tv/video/16937',
+        'info_dict': {
+            'id': '16937',
+            'ext': 'mp4',
+            'title': '[V LIVE] 첸백시 걍방',
+            'creator': 'EXO',
+            'view_count': int,
+            'subtitles': 'mincount:12',
+            'uploader_id': 'muploader_j',
+        },
+        'params': {
+            'skip_download': True,
+        },
+    }, {
+        'url': 'https://www.vlive.tv/video/129100',
+        'md5': 'ca2569453b79d66e5b919e5d308bff6b',
+        'info_dict': {
+            'id': '129100',
+            'ext': 'mp4',
+            'title': '[V LIVE] [BTS+] Run BTS! 2019 - EP.71 :: Behind the scene',
+            'creator': 'BTS+',
+            'view_count': int,
+            'subtitles': 'mincount:10',
+        },
+        'skip': 'This video is only available for CH+ subscribers',
+    }]
+
+    @classmethod
+    def suitable(cls, url):
+        return False if VLivePlaylistIE.suitable(url) else super(VLiveIE, cls).suitable(url)
+
+    def _real_extract(self, url):
+        video_id = self._match_id(url)
+        key_path = f'video/v1.0/vod/{video_id}/inkey'
+
+        # The inkey only depends on video_id, so request it while the video
+        # page is downloading; the result is simply discarded for lives
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            key_future = executor.submit(
+                self._call_api, key_path, video_id,
+                note='Getting key', errnote=False, fatal=False)
+            webpage = self._download_webpage(
+                f'https://www.vlive.tv/video/{video_id}', video_id)
+            key_json = key_future.result()
+
+        preload_state = self._parse_preload_state(webpage, video_id)
+
+        return self._extract_from_preload_state(
+            video_id, preload_state, key_json)
+
     def _download_init_page(self, video_id):
         return self._download_webpage(
             'https://www.vlive.tv/video/init/view',
@@ -197,6 +295,7 @@ class VLiveIE(NaverBaseIE):
 class VLiveChannelIE(InfoExtractor):
     IE_NAME = 'vlive:channel'
     _VALID_URL = r'https?://channels\.vlive\.tv/(?P<id>[0-9A-Z]+)'
+    _VALID_URL_RE = re.compile(_VALID_URL)
     _TEST = {
         'url': 'http://channels.vlive.tv/FCD4B',
         'info_dict': {
@@ -206,80 +305,110 @@ class VLiveChannelIE(InfoExtractor):
         'playlist_mincount': 110
     }
     _APP_ID = '8c6cc7b45d2568fb668be6e05b6e5a3b'
+    _MAX_WORKERS = 4
+    _learned_app_id = None
 
-    def _real_extract(self, url):
-        channel_code = self._match_id(url)
-
+    def _extract_app_id(self, channel_code):
         webpage = self._download_webpage(
             'http://channels.vlive.tv/%s/video' % channel_code, channel_code)
 
-        app_id = None
-
         app_js_url = self._search_regex(
-            r'<script[^>]+src=(["\'])(?P<url>http.+?/app\.js.*?)\1',
-            webpage, 'app js', default=None, group='url')
+            _APP_JS_RE, webpage, 'app js', default=None, group='url')
 
         if app_js_url:
             app_js = self._download_webpage(
                 app_js_url, channel_code, 'Downloading app JS', fatal=False)
             if app_js:
-                app_id = self._search_regex(
-                    r'Global\.VFAN_APP_ID\s*=\s*[\'"]([^\'"]+)[\'"]',
-                    app_js, 'app id', default=None)
-
-        app_id = app_id or self._APP_ID
+                return self._search_regex(
+                    _APP_ID_RE, app_js, 'app id', default=None)
 
+    def _decode_channel_code(self, channel_code, app_id,
+                             errnote='Unable to download JSON metadata',
+                             fatal=True):
         channel_info = self._download_json(
             'http://api.vfan.vlive.tv/vproxy/channelplus/decodeChannelCode',
             channel_code, note='Downloading decode channel code',
+            errnote=errnote, fatal=fatal,
             query={
                 'app_id': app_id,
                 'channelCode': channel_code,
-                '_': int(time.time())
+                '_': next(self._ts_counter)
+            })
+        return ((channel_info or {}).get('result') or {}).get('channelSeq')
+
+    def _download_video_list(self, channel_code, app_id, channel_seq, page_num):
+        return self._download_json(
+            'http://api.vfan.vlive.tv/vproxy/channelplus/getChannelVideoList',
+            channel_code, note='Downloading channel list page #%d' % page_num,
+            query={
+                'app_id': app_id,
+                'channelSeq': channel_seq,
+                # Large values of maxNumOfRows (~300 or above) may cause
+                # empty responses (see [1]), e.g. this happens for [2] that
+                # has more than 300 videos.
+                # 1. https://github.com/ytdl-org/youtube-dl/issues/13830
+                # 2. http://channels.vlive.tv/EDBF.
+                'maxNumOfRows': 100,
+                '_': next(self._ts_counter),
+                'pageNo': page_num
             })
 
-        channel_seq = channel_info['result']['channelSeq']
+    def _real_extract(self, url):
+        channel_code = self._match_id(url)
+        # The "_" query parameter is only a cache buster, so it just has to
+        # differ between requests
+        self._ts_counter = itertools.count(int(time.time()))
+
+        # The default app id is tried first; app.js is only consulted when it
+        # has been rotated and the new one is then reused for later channels
+        app_id = VLiveChannelIE._learned_app_id or self._APP_ID
+        channel_seq = self._decode_channel_code(
+            channel_code, app_id, errnote=False, fatal=False)
+        if not channel_seq:
+            new_app_id = self._extract_app_id(channel_code)
+            if new_app_id and new_app_id != app_id:
+                app_id = VLiveChannelIE._learned_app_id = new_app_id
+            # Retry fatally so that the underlying error gets reported
+            channel_seq = self._decode_channel_code(channel_code, app_id)
+        if not channel_seq:
+            raise ExtractorError('Unable to decode channel code')
+
         channel_name = None
         entries = []
 
-        for page_num in itertools.count(1):
-            video_list = self._download_json(
-                'http://api.vfan.vlive.tv/vproxy/channelplus/getChannelVideoList',
-                channel_code, note='Downloading channel list page #%d' % page_num,
-                query={
-                    'app_id': app_id,
-                    'channelSeq': channel_seq,
-                    # Large values of maxNumOfRows (~300 or above) may cause
-                    # empty responses (see [1]), e.g. this happens for [2] that
-                    # has more than 300 videos.
-                    # 1. https://github.com/ytdl-org/youtube-dl/issues/13830
-                    # 2. http://channels.vlive.tv/EDBF.
-                    'maxNumOfRows': 100,
-                    '_': int(time.time()),
-                    'pageNo': page_num
-                }
-            )
-
-            if not channel_name:
-                channel_name = try_get(
-                    video_list,
-                    lambda x: x['result']['channelInfo']['channelName'],
-                    compat_str)
-
-            videos = try_get(
-                video_list, lambda x: x['result']['videoList'], list)
-            if not videos:
-                break
-
-            for video in videos:
-                video_id = video.get('videoSeq')
-                if not video_id:
-                    continue
-                video_id = compat_str(video_id)
-                entries.append(
-                    self.url_result(
-                        'http://www.vlive.tv/video/%s' % video_id,
-                        ie=VLiveIE.ie_key(), video_id=video_id))
+        # Pages are fetched speculatively in windows of `workers` pages;
+        # the first empty page marks the end of the channel
+        workers = int_or_none(self._downloader.params.get(
+            'concurrent_fragment_downloads')) or self._MAX_WORKERS
+        download_page = functools.partial(
+            self._download_video_list, channel_code, app_id, channel_seq)
+        ie_key = VLiveIE.ie_key()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for first_page in itertools.count(1, workers):
+                finished = False
+                for video_list in executor.map(
+                        download_page, range(first_page, first_page + workers)):
+                    result = video_list.get('result') or {}
+                    channel_name = channel_name or (
+                        result.get('channelInfo') or {}).get('channelName')
+
+                    videos = result.get('videoList')
+                    if not videos:
+                        finished = True
+                        break
+
+                    for video in videos:
+                        video_id = video.get('videoSeq')
+                        if not video_id:
+                            continue
+                        video_id = compat_str(video_id)
+                        entries.append(
+                            self.url_result(
+                                f'http://www.vlive.tv/video/{video_id}',
+                                ie=ie_key, video_id=video_id))
+                if finished:
+                    break
 
         return self.playlist_result(
             entries, channel_code, channel_name)
@@ -288,6 +417,7 @@ class VLiveChannelIE(InfoExtractor):
 class VLivePlaylistIE(InfoExtractor):
     IE_NAME = 'vlive:playlist'
     _VALID_URL = r'https?://(?:(?:www|m)\.)?vlive\.tv/video/(?P<video_id>[0-9]+)/playlist/(?P<id>[0-9]+)'
+    _VALID_URL_RE = re.compile(_VALID_URL)
     _VIDEO_URL_TEMPLATE = 'http://www.vlive.tv/video/%s'
     _TESTS = [{
         # regular working playlist
@@ -318,8 +448,30 @@ class VLivePlaylistIE(InfoExtractor):
             self._VIDEO_URL_TEMPLATE % video_id,
             ie=VLiveIE.ie_key(), video_id=video_id)
 
+    def _extract_playlist_name(self, webpage):
+        # The title is the <h3> right inside the div with the unique
+        # multicam_playlist class, so plain substring search is enough in
+        # the common case
+        start = webpage.find('multicam_playlist')
+        if start != -1:
+            start = webpage.find('>', start)
+        if start != -1:
+            start += 1
+            while start < len(webpage) and webpage[start].isspace():
+                start += 1
+            start = webpage.find('>', start) if webpage.startswith('<h3', start) else -1
+        if start != -1:
+            end = webpage.find('<', start + 1)
+            if end != -1:
+                playlist_name = clean_html(webpage[start + 1:end])
+                if playlist_name:
+                    return playlist_name
+        return self._html_search_regex(
+            r'<div[^>]+class="[^"]*multicam_playlist[^>]*>\s*<h3[^>]+>([^<]+)',
+            webpage, 'playlist title', fatal=False)
+
     def _real_extract(self, url):
-        mobj = re.match(self._VALID_URL, url)
+        mobj = self._VALID_URL_RE.match(url)
         video_id, playlist_id = mobj.group('video_id', 'id')
 
         if self._downloader.params.get('noplaylist'):
@@ -337,7 +489,7 @@ class VLivePlaylistIE(InfoExtractor):
             % (video_id, playlist_id), playlist_id)
 
         raw_item_ids = self._search_regex(
-            r'playlistVideoSeqs\s*=\s*(\[[^]]+\])', webpage,
+            _PLAYLIST_SEQS_RE, webpage,
             'playlist video seqs', default=None, fatal=False)
 
         if not raw_item_ids:
@@ -348,21 +500,22 @@ class VLivePlaylistIE(InfoExtractor):
 
         item_ids = self._parse_json(raw_item_ids, playlist_id)
 
-        entries = [
-            self.url_result(
-                self._VIDEO_URL_TEMPLATE % item_id, ie=VLiveIE.ie_key(),
-                video_id=compat_str(item_id))
-            for item_id in item_ids]
+        # Entries are produced lazily as the downloader consumes them
+        make_result = functools.partial(self.url_result, ie=VLiveIE.ie_key())
+        tmpl = self._VIDEO_URL_TEMPLATE
+        entries = (
+            make_result(tmpl % item_id, video_id=compat_str(item_id))
+            for item_id in item_ids)
 
-        playlist_name = self._html_search_regex(
-            r'<div[^>]+class="[^"]*multicam_playlist[^>]*>\s*<h3[^>]+>([^<]+)',
-            webpage, 'playlist title', fatal=False)
+        playlist_name = self._extract_playlist_name(webpage)
 
         return self.playlist_result(entries, playlist_id, playlist_name)
 
-class VLivePostIE(InfoExtractor):
+
+class VLivePostIE(VLiveBaseIE):
     IE_NAME = 'vlive:post'
     _VALID_URL = r'https?://(?:(?:www|m)\.)?vlive\.tv/post/(?P<id>[\d-]+)'
+    _VALID_URL_RE = re.compile(_VALID_URL)
     _VIDEO_URL_TEMPLATE = 'http://www.vlive.tv/video/%s'
 
     _TESTS = [{
@@ -381,15 +534,15 @@ class VLivePostIE(InfoExtractor):
         video_id = self._match_id(url)
         webpage = self._download_webpage(url, video_id)
 
-        PRELOAD_STATE_RE = r'>window\.__PRELOADED_STATE__=({.+})</script>'
-        PRELOAD_STATE_FIELD = 'preload state'
+        preload_state = self._parse_preload_state(webpage, video_id)
 
-        preload_state = self._parse_json(
-                self._search_regex(
-                    PRELOAD_STATE_RE, webpage, PRELOAD_STATE_FIELD),
-                video_id)
+        official = preload_state['postDetail']['post']['officialVideo']
+        vid_id = compat_str(official['videoSeq'])
 
-        vid_id = preload_state['postDetail']['post']['officialVideo']['videoSeq']
+        # The post page embeds the same preload state as the video page, so
+        # extract directly instead of downloading the video page again
+        if official.get('type') and preload_state.get('channel'):
+            return self._extract_from_preload_state(vid_id, preload_state)
 
         return self.url_result(
             self._VIDEO_URL_TEMPLATE % vid_id,